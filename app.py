@@ -2,20 +2,39 @@
 Application Flask pour l'analyse de sentiments
 """
 import os
-from flask import Flask, render_template, request, jsonify
+import re
+import uuid
+from flask import Flask, render_template, request, jsonify, g, abort, url_for
 from dotenv import load_dotenv
 import logging
 
 # Chargement des variables d'environnement
 load_dotenv()
 
-# Configuration du logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Configuration du logging (JSON, asynchrone, échantillonné)
+try:
+    from src.logging_config import env_log_level, env_sample_rate, setup_logging
+    LOG_SAMPLE_RATE = env_sample_rate('LOG_SAMPLE_RATE')
+    setup_logging(
+        level=env_log_level('LOG_LEVEL'),
+        sample_rates={
+            logging.DEBUG: env_sample_rate('LOG_SAMPLE_RATE_DEBUG', LOG_SAMPLE_RATE),
+            logging.INFO: env_sample_rate('LOG_SAMPLE_RATE_INFO', LOG_SAMPLE_RATE),
+        }
+    )
+    LOGGING_ERROR = None
+except ImportError as e:
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    LOGGING_ERROR = e
 logger = logging.getLogger(__name__)
 
+if LOGGING_ERROR is not None:
+    logger.warning("⚠️  Logging JSON asynchrone indisponible (%s) : "
+                   "repli sur le logging standard synchrone", LOGGING_ERROR)
+
 # Importation de notre package
 try:
     from src.sentiment_analyzer import analyze_sentiment
@@ -24,13 +43,27 @@ try:
     logger.info("✅ Package sentiment_analysis chargé avec succès")
 except ImportError as e:
     PACKAGE_LOADED = False
-    logger.error(f"❌ Erreur chargement package: {e}")
+    logger.error("❌ Erreur chargement package: %s", e)
+
+# Cache des pages et fichiers statiques (indépendant du package d'analyse)
+try:
+    from src.static_assets import CachedContent, StaticAssets, ONE_YEAR
+    STATIC_CACHE_LOADED = True
+except ImportError as e:
+    STATIC_CACHE_LOADED = False
+    logger.error("❌ Erreur chargement cache statique: %s", e)
 
 # Création de l'application Flask
 app = Flask(__name__)
 app.config['SECRET_KEY'] = os.getenv('FLASK_SECRET_KEY', 'dev-secret-key')
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max
 
+# Fichiers statiques chargés, empreintés et compressés au démarrage
+STATIC_ASSETS = StaticAssets(app.static_folder) if STATIC_CACHE_LOADED else None
+
+# Pages rendues une seule fois (leurs paramètres sont fixes)
+_page_cache = {}
+
 # Variables d'environnement Watson
 WATSON_API_KEY = os.getenv('WATSON_API_KEY')
 WATSON_URL = os.getenv('WATSON_URL')
@@ -40,6 +73,53 @@ if not WATSON_API_KEY or not WATSON_URL:
     logger.warning("⚠️  Variables d'environnement Watson non configurées")
     logger.warning("   Utilisation du mode démo (résultats simulés)")
 
+### IDENTIFIANT DE REQUÊTE ###
+
+# Identifiants acceptés depuis le client ; sinon un nouvel identifiant est généré
+REQUEST_ID_PATTERN = re.compile(r'[A-Za-z0-9._-]{1,64}')
+
+@app.before_request
+def assign_request_id():
+    """
+    Attribue un identifiant à chaque requête (repris de X-Request-ID si valide)
+    """
+    request_id = request.headers.get('X-Request-ID', '')
+    if not REQUEST_ID_PATTERN.fullmatch(request_id):
+        request_id = uuid.uuid4().hex
+    g.request_id = request_id
+
+@app.after_request
+def add_request_id_header(response):
+    """
+    Renvoie l'identifiant de requête pour le traçage
+    """
+    response.headers['X-Request-ID'] = g.get('request_id', '')
+    return response
+
+### FICHIERS STATIQUES ###
+
+@app.template_global()
+def asset_url(filename: str) -> str:
+    """
+    URL avec empreinte d'un fichier statique
+
+    Repli sur /static en mode debug, où les fichiers peuvent changer
+    sans redémarrage, ou si le cache n'est pas disponible.
+    """
+    if STATIC_ASSETS is None or app.debug:
+        return url_for('static', filename=filename)
+    return url_for('assets', filename=STATIC_ASSETS.fingerprint(filename))
+
+@app.route('/assets/<path:filename>')
+def assets(filename):
+    """
+    Fichiers statiques empreintés, en cache navigateur permanent
+    """
+    asset = STATIC_ASSETS.get(filename) if STATIC_ASSETS else None
+    if asset is None:
+        abort(404)
+    return asset.make_response(max_age=ONE_YEAR, immutable=True)
+
 ### ROUTES DE L'APPLICATION ###
 
 @app.route('/')
@@ -48,19 +128,30 @@ def home():
     Page d'accueil - Interface web
     """
     logger.info("Accès page d'accueil")
-    return render_template(
-        'index.html',
-        app_name="Analyseur de Sentiments",
-        package_loaded=PACKAGE_LOADED,
-        watson_configured=bool(WATSON_API_KEY and WATSON_URL)
-    )
+
+    # Rendu unique (paramètres fixes), sauf en mode debug où les templates
+    # et fichiers statiques peuvent changer : la page n'est alors pas mise en cache
+    page = _page_cache.get('home')
+    if page is None or app.debug:
+        html = render_template(
+            'index.html',
+            app_name="Analyseur de Sentiments",
+            package_loaded=PACKAGE_LOADED,
+            watson_configured=bool(WATSON_API_KEY and WATSON_URL)
+        )
+        if not STATIC_CACHE_LOADED:
+            return html
+        page = CachedContent(html.encode('utf-8'), 'text/html')
+        if not app.debug:
+            _page_cache['home'] = page
+    return page.make_response()
 
 @app.route('/analyze', methods=['POST'])
 def analyze():
     """
     Endpoint API pour l'analyse de sentiments
     """
-    logger.info("Requête d'analyse reçue")
+    logger.info("Requête d'analyse reçue", extra={'sample': True})
     
     # Récupération du texte
     data = request.get_json()
@@ -76,13 +167,13 @@ def analyze():
     # Validation du texte
     validation = validate_text(text)
     if not validation['valid']:
-        logger.warning(f"Texte invalide: {validation['message']}")
+        logger.warning("Texte invalide: %s", validation['message'])
         return jsonify({
             'error': 'Texte invalide',
             'message': validation['message']
         }), 400
     
-    logger.info(f"Analyse de texte ({len(text)} caractères)")
+    logger.info("Analyse de texte (%d caractères)", len(text), extra={'sample': True})
     
     try:
         # Analyse du sentiment
@@ -101,12 +192,16 @@ def analyze():
         
         # Log du résultat
         sentiment = formatted_result.get('sentiment_fr', 'Inconnu')
-        logger.info(f"Résultat: {sentiment} (score: {result.get('score', 0):.3f})")
+        logger.info(
+            "Résultat: %s (score: %.3f)", sentiment, result.get('score', 0),
+            extra={'sample': True}
+        )
         
+        formatted_result['request_id'] = g.request_id
         return jsonify(formatted_result)
         
     except Exception as e:
-        logger.exception(f"Erreur lors de l'analyse: {e}")
+        logger.exception("Erreur lors de l'analyse: %s", e)
         return jsonify({
             'error': 'Erreur interne',
             'message': 'Une erreur est survenue lors de l\'analyse.',
@@ -184,7 +279,7 @@ def demo_sentiment_analysis(text: str) -> dict:
 
 @app.errorhandler(404)
 def not_found(error):
-    logger.warning(f"Page non trouvée: {request.path}")
+    logger.warning("Page non trouvée: %s", request.path)
     if request.path.startswith('/api/'):
         return jsonify({
             'error': 'Endpoint non trouvé',
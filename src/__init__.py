@@ -2,7 +2,8 @@
 Package sentiment_analysis - Analyse de sentiments avec Watson AI
 """
 
-from .sentiment_analyzer import SentimentAnalyzer, analyze_sentiment
+import importlib
+
 from .utils import format_sentiment_result, validate_text
 
 __version__ = "1.0.0"
@@ -16,4 +17,17 @@ __all__ = [
     'validate_text'
 ]
 
+# Import différé de l'analyseur (dépend de requests) : les autres modules
+# du package (logging, fichiers statiques) restent importables sans lui
+_LAZY_ATTRS = {
+    'SentimentAnalyzer': '.sentiment_analyzer',
+    'analyze_sentiment': '.sentiment_analyzer',
+}
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        module = importlib.import_module(_LAZY_ATTRS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 print(f"✅ Package sentiment_analysis v{__version__} chargé avec succès!")
\ No newline at end of file
@@ -0,0 +1,178 @@
+"""
+Configuration du logging asynchrone, structuré (JSON) et échantillonné
+"""
+import atexit
+import hashlib
+import json
+import logging
+import os
+import queue
+import random
+import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
+
+from flask import g, has_request_context
+
+# Attributs standards d'un LogRecord, exclus des champs "extra" du JSON
+_RESERVED_ATTRS = frozenset(vars(logging.makeLogRecord({}))) | {
+    'message', 'asctime', 'request_id', 'sample'
+}
+
+
+class RequestIdFilter(logging.Filter):
+    """Attache l'identifiant de la requête Flask courante à chaque record"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, 'request_id'):
+            record.request_id = (
+                g.get('request_id') if has_request_context() else None
+            )
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Échantillonne les records marqués ``extra={'sample': True}``
+
+    Le taux est choisi par niveau ; la décision est dérivée de l'identifiant
+    de requête pour conserver ou écarter ensemble toutes les lignes d'une
+    même requête. Le hachage est salé par une clé secrète propre au
+    processus : un client qui fournit son X-Request-ID ne peut pas choisir
+    d'être écarté. Les records sans identifiant sont tirés au hasard et les
+    records non marqués sont toujours conservés.
+    """
+
+    def __init__(self, rates: Dict[int, float]):
+        super().__init__()
+        self.rates = rates
+        self._key = os.urandom(16)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not getattr(record, 'sample', False):
+            return True
+
+        rate = self.rates.get(record.levelno, 1.0)
+        if rate >= 1.0:
+            return True
+        if rate <= 0.0:
+            return False
+
+        request_id = getattr(record, 'request_id', None)
+        if not request_id:
+            return random.random() < rate
+
+        digest = hashlib.blake2b(
+            request_id.encode('utf-8'), key=self._key, digest_size=8
+        ).digest()
+        return int.from_bytes(digest, 'big') / 2 ** 64 < rate
+
+
+def env_sample_rate(name: str, default: float = 1.0) -> float:
+    """
+    Lit un taux d'échantillonnage, borné à [0, 1]
+
+    Args:
+        name: Nom de la variable d'environnement
+        default: Valeur si absente ou invalide
+
+    Returns:
+        Taux entre 0.0 et 1.0
+    """
+    try:
+        rate = float(os.getenv(name, default))
+    except ValueError:
+        rate = default
+    return max(0.0, min(1.0, rate))
+
+
+def env_log_level(name: str, default: int = logging.INFO) -> int:
+    """
+    Lit un niveau de log (DEBUG, INFO, ...)
+
+    Args:
+        name: Nom de la variable d'environnement
+        default: Niveau si absent ou inconnu
+
+    Returns:
+        Niveau numérique
+    """
+    level = logging.getLevelName(os.getenv(name, '').upper())
+    return level if isinstance(level, int) else default
+
+
+class JsonFormatter(logging.Formatter):
+    """Formate chaque record en une ligne JSON"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'timestamp': datetime.fromtimestamp(
+                record.created, tz=timezone.utc
+            ).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'request_id': getattr(record, 'request_id', None),
+        }
+
+        # Champs supplémentaires passés via extra={...}
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_ATTRS and not key.startswith('_'):
+                entry[key] = value
+
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler qui ne formate pas le message dans le thread appelant
+
+    Le QueueHandler standard appelle ``format()`` avant la mise en file ;
+    ici le record est transmis tel quel et le formatage est laissé au
+    thread du QueueListener.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def setup_logging(level: int = logging.INFO,
+                  sample_rates: Optional[Dict[int, float]] = None,
+                  stream=None) -> QueueListener:
+    """
+    Installe un logging asynchrone sur le logger racine
+
+    Args:
+        level: Niveau minimal de log
+        sample_rates: Taux d'échantillonnage par niveau (0.0 à 1.0)
+        stream: Flux de sortie (stderr par défaut)
+
+    Returns:
+        Le QueueListener démarré, arrêté automatiquement à la sortie
+        (pour l'arrêter plus tôt : ``atexit.unregister(listener.stop)``
+        puis ``listener.stop()``)
+    """
+    log_queue = queue.SimpleQueue()
+
+    stream_handler = logging.StreamHandler(stream or sys.stderr)
+    stream_handler.setFormatter(JsonFormatter())
+
+    queue_handler = _DeferredQueueHandler(log_queue)
+    queue_handler.addFilter(RequestIdFilter())
+    queue_handler.addFilter(SamplingFilter(sample_rates or {}))
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+
+    listener = QueueListener(log_queue, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+
+    return listener
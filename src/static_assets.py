@@ -0,0 +1,157 @@
+"""
+Mise en cache des fichiers statiques et des pages pré-rendues
+
+Les fichiers statiques sont chargés une seule fois au démarrage, nommés
+d'après une empreinte de leur contenu (cache "immutable" côté navigateur)
+et pré-compressés en gzip et, si le module ``brotli`` est installé, en br.
+"""
+import gzip
+import hashlib
+import mimetypes
+import os
+from typing import Dict, Optional
+
+from flask import Response, request
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Types déjà compressés ou binaires : inutile de les recompresser
+COMPRESSIBLE_TYPES = (
+    'text/', 'application/javascript', 'application/json', 'image/svg+xml'
+)
+
+# Ordre de préférence des encodages proposés au client
+ENCODINGS = ('br', 'gzip')
+
+ONE_YEAR = 365 * 24 * 3600
+
+
+def compress_variants(data: bytes, mimetype: str) -> Dict[str, bytes]:
+    """
+    Produit les variantes compressées d'un contenu
+
+    Args:
+        data: Contenu brut
+        mimetype: Type MIME du contenu
+
+    Returns:
+        Dict encodage -> contenu ('identity' toujours présent)
+    """
+    variants = {'identity': data}
+    if not data or not mimetype.startswith(COMPRESSIBLE_TYPES):
+        return variants
+
+    variants['gzip'] = gzip.compress(data, compresslevel=9, mtime=0)
+    if brotli is not None:
+        variants['br'] = brotli.compress(data)
+
+    # On ne garde que les variantes réellement plus petites
+    return {
+        encoding: body for encoding, body in variants.items()
+        if encoding == 'identity' or len(body) < len(data)
+    }
+
+
+class CachedContent:
+    """Contenu servi depuis la mémoire avec son ETag et ses variantes"""
+
+    def __init__(self, data: bytes, mimetype: str):
+        self.mimetype = mimetype
+        self.digest = hashlib.sha256(data).hexdigest()
+        self.variants = compress_variants(data, mimetype)
+
+    def make_response(self, max_age: int = 0, immutable: bool = False) -> Response:
+        """
+        Construit la réponse adaptée à la requête courante
+
+        Choisit l'encodage selon Accept-Encoding et répond 304 si
+        l'ETag envoyé par le client correspond.
+
+        Args:
+            max_age: Durée de cache navigateur en secondes
+            immutable: Marque la ressource comme immuable
+
+        Returns:
+            Réponse Flask
+        """
+        encoding = 'identity'
+        for candidate in ENCODINGS:
+            if candidate in self.variants and request.accept_encodings[candidate]:
+                encoding = candidate
+                break
+
+        response = Response(self.variants[encoding], mimetype=self.mimetype)
+        if encoding != 'identity':
+            response.headers['Content-Encoding'] = encoding
+        response.vary.add('Accept-Encoding')
+
+        # ETag distinct par encodage : les octets envoyés diffèrent
+        response.set_etag(f"{self.digest[:32]}-{encoding}")
+        response.cache_control.public = True
+        response.cache_control.max_age = max_age
+        if immutable:
+            response.cache_control.immutable = True
+        else:
+            response.cache_control.no_cache = True
+
+        return response.make_conditional(request)
+
+
+class StaticAssets:
+    """Fichiers statiques chargés en mémoire et adressés par empreinte"""
+
+    def __init__(self, static_folder: str):
+        """
+        Charge et empreinte tous les fichiers du dossier statique
+
+        Args:
+            static_folder: Chemin du dossier des fichiers statiques
+        """
+        self.static_folder = static_folder
+        self.urls = {}  # nom logique -> nom avec empreinte
+        self.assets = {}  # nom avec empreinte -> CachedContent
+        self._load()
+
+    def _load(self):
+        for root, _, files in os.walk(self.static_folder):
+            for name in files:
+                path = os.path.join(root, name)
+                filename = os.path.relpath(path, self.static_folder).replace(os.sep, '/')
+
+                with open(path, 'rb') as f:
+                    data = f.read()
+
+                mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+                asset = CachedContent(data, mimetype)
+
+                base, ext = os.path.splitext(filename)
+                fingerprinted = f"{base}.{asset.digest[:12]}{ext}"
+                self.urls[filename] = fingerprinted
+                self.assets[fingerprinted] = asset
+
+    def fingerprint(self, filename: str) -> str:
+        """
+        Retourne le nom avec empreinte d'un fichier statique
+
+        Args:
+            filename: Chemin relatif au dossier statique
+
+        Returns:
+            Nom avec empreinte, ou le nom d'origine si inconnu
+        """
+        return self.urls.get(filename, filename)
+
+    def get(self, fingerprinted: str) -> Optional[CachedContent]:
+        """
+        Retourne le contenu en cache pour un nom avec empreinte
+
+        Args:
+            fingerprinted: Nom avec empreinte
+
+        Returns:
+            Contenu en cache ou None
+        """
+        return self.assets.get(fingerprinted)
@@ -0,0 +1,193 @@
+"""
+Tests unitaires pour la configuration du logging
+"""
+import atexit
+import io
+import json
+import logging
+import subprocess
+import unittest
+import sys
+import os
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app import app
+from src.logging_config import (
+    JsonFormatter, SamplingFilter, env_log_level, env_sample_rate, setup_logging
+)
+
+def make_record(level=logging.INFO, msg="message", args=(), **extra):
+    """Construit un LogRecord avec des attributs supplémentaires"""
+    record = logging.LogRecord("test", level, __file__, 1, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+class TestJsonFormatter(unittest.TestCase):
+    """Tests pour le formateur JSON"""
+
+    def test_format_fields(self):
+        """Test des champs produits"""
+        record = make_record(msg="Résultat: %s", args=("Positif",),
+                             request_id="abc", score=0.5)
+        entry = json.loads(JsonFormatter().format(record))
+
+        self.assertEqual(entry["message"], "Résultat: Positif")
+        self.assertEqual(entry["level"], "INFO")
+        self.assertEqual(entry["request_id"], "abc")
+        self.assertEqual(entry["score"], 0.5)
+
+class TestSamplingFilter(unittest.TestCase):
+    """Tests pour l'échantillonnage"""
+
+    def test_unmarked_records_kept(self):
+        """Les records non marqués ne sont jamais écartés"""
+        sampler = SamplingFilter({logging.INFO: 0.0})
+        self.assertTrue(sampler.filter(make_record()))
+
+    def test_rate_per_level(self):
+        """Le taux s'applique par niveau"""
+        sampler = SamplingFilter({logging.INFO: 0.0})
+        self.assertFalse(sampler.filter(make_record(sample=True)))
+        self.assertTrue(sampler.filter(make_record(logging.WARNING, sample=True)))
+
+    def test_same_request_same_decision(self):
+        """Toutes les lignes d'une requête sont conservées ou écartées ensemble"""
+        sampler = SamplingFilter({logging.INFO: 0.5})
+        decisions = []
+        for i in range(200):
+            first = sampler.filter(make_record(sample=True, request_id=f"r{i}"))
+            second = sampler.filter(make_record(sample=True, request_id=f"r{i}"))
+            self.assertEqual(first, second)
+            decisions.append(first)
+
+        # Au taux de 0.5, une partie est conservée et une partie écartée
+        self.assertIn(True, decisions)
+        self.assertIn(False, decisions)
+        self.assertTrue(50 < decisions.count(True) < 150)
+
+    def test_without_request_id_random(self):
+        """Sans identifiant, le tirage est aléatoire et non par rafales"""
+        sampler = SamplingFilter({logging.INFO: 0.5})
+        decisions = [sampler.filter(make_record(sample=True)) for _ in range(2000)]
+
+        # Chaque moitié mélange conservation et rejet
+        for half in (decisions[:1000], decisions[1000:]):
+            self.assertTrue(300 < half.count(True) < 700)
+
+    def test_hash_keyed_per_instance(self):
+        """La décision dépend d'une clé secrète, pas du seul identifiant"""
+        first, second = SamplingFilter({logging.INFO: 0.5}), SamplingFilter({logging.INFO: 0.5})
+        ids = [f"r{i}" for i in range(200)]
+        self.assertNotEqual(
+            [first.filter(make_record(sample=True, request_id=i)) for i in ids],
+            [second.filter(make_record(sample=True, request_id=i)) for i in ids]
+        )
+
+class TestEnvParsing(unittest.TestCase):
+    """Tests de lecture des variables d'environnement"""
+
+    def test_sample_rate(self):
+        """Taux invalide remplacé par la valeur par défaut, hors bornes ramené à [0, 1]"""
+        with mock.patch.dict(os.environ, {'RATE': 'abc'}):
+            self.assertEqual(env_sample_rate('RATE'), 1.0)
+        with mock.patch.dict(os.environ, {'RATE': '7'}):
+            self.assertEqual(env_sample_rate('RATE'), 1.0)
+        with mock.patch.dict(os.environ, {'RATE': '-1'}):
+            self.assertEqual(env_sample_rate('RATE'), 0.0)
+        with mock.patch.dict(os.environ, {'RATE': '0.25'}):
+            self.assertEqual(env_sample_rate('RATE'), 0.25)
+
+    def test_log_level(self):
+        """Seuls les noms de niveaux sont acceptés"""
+        with mock.patch.dict(os.environ, {'LEVEL': 'debug'}):
+            self.assertEqual(env_log_level('LEVEL'), logging.DEBUG)
+        for value in ('basic_format', 'nope', ''):
+            with mock.patch.dict(os.environ, {'LEVEL': value}):
+                self.assertEqual(env_log_level('LEVEL'), logging.INFO)
+
+class TestSetupLogging(unittest.TestCase):
+    """Tests d'intégration du logging asynchrone"""
+
+    def setUp(self):
+        self.root = logging.getLogger()
+        self.saved_handlers = list(self.root.handlers)
+        self.saved_level = self.root.level
+
+    def tearDown(self):
+        for handler in list(self.root.handlers):
+            self.root.removeHandler(handler)
+        for handler in self.saved_handlers:
+            self.root.addHandler(handler)
+        self.root.setLevel(self.saved_level)
+
+    def test_records_written_as_json(self):
+        """Les records passent par la file et sortent en JSON"""
+        stream = io.StringIO()
+        listener = setup_logging(stream=stream)
+        logging.getLogger("test").info("bonjour %s", "monde")
+        atexit.unregister(listener.stop)
+        listener.stop()
+
+        entry = json.loads(stream.getvalue().strip())
+        self.assertEqual(entry["message"], "bonjour monde")
+        self.assertIsNone(entry["request_id"])
+
+    def test_without_analyzer(self):
+        """Le logging JSON est installé même si l'analyseur ne se charge pas"""
+        script = (
+            "import sys, logging\n"
+            "sys.modules['requests'] = None\n"
+            "import app\n"
+            "print(app.PACKAGE_LOADED, type(logging.getLogger().handlers[0]).__name__)\n"
+        )
+        output = subprocess.run(
+            [sys.executable, '-c', script],
+            cwd=os.path.join(os.path.dirname(__file__), '..'),
+            capture_output=True, text=True, check=True
+        ).stdout
+        self.assertEqual(output.strip().splitlines()[-1], "False _DeferredQueueHandler")
+
+    def test_fallback_warns(self):
+        """Le repli sur le logging standard est signalé"""
+        script = (
+            "import sys\n"
+            "sys.modules['src.logging_config'] = None\n"
+            "import app\n"
+        )
+        result = subprocess.run(
+            [sys.executable, '-c', script],
+            cwd=os.path.join(os.path.dirname(__file__), '..'),
+            capture_output=True, text=True, check=True
+        )
+        self.assertIn("Logging JSON asynchrone indisponible", result.stderr)
+
+class TestRequestId(unittest.TestCase):
+    """Tests de l'identifiant de requête renvoyé par l'application"""
+
+    def setUp(self):
+        self.client = app.test_client()
+
+    def test_generated_id_returned(self):
+        """L'identifiant est renvoyé dans l'en-tête et dans le corps"""
+        response = self.client.post('/analyze', json={'text': 'super bon'})
+        request_id = response.headers['X-Request-ID']
+        self.assertRegex(request_id, r'^[0-9a-f]{32}$')
+        self.assertEqual(response.get_json()['request_id'], request_id)
+
+    def test_supplied_id_echoed(self):
+        """Un identifiant valide fourni par le client est repris"""
+        response = self.client.post('/analyze', json={'text': 'super bon'},
+                                    headers={'X-Request-ID': 'trace-42.a_b'})
+        self.assertEqual(response.headers['X-Request-ID'], 'trace-42.a_b')
+        self.assertEqual(response.get_json()['request_id'], 'trace-42.a_b')
+
+    def test_invalid_id_replaced(self):
+        """Un identifiant trop long ou invalide est remplacé"""
+        for supplied in ('a' * 65, 'bad id', 'x<script>'):
+            response = self.client.get('/health', headers={'X-Request-ID': supplied})
+            self.assertRegex(response.headers['X-Request-ID'], r'^[0-9a-f]{32}$')
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
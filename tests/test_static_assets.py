@@ -0,0 +1,198 @@
+"""
+Tests unitaires pour le cache des fichiers statiques
+"""
+import gzip
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import brotli
+from flask import Flask
+
+from app import app
+from src.static_assets import CachedContent, StaticAssets, compress_variants
+
+class TestCompressVariants(unittest.TestCase):
+    """Tests pour la pré-compression"""
+
+    def test_text_is_gzipped(self):
+        """Le texte est compressé en gzip"""
+        data = b"body { color: red; }\n" * 50
+        variants = compress_variants(data, 'text/css')
+        self.assertEqual(gzip.decompress(variants['gzip']), data)
+
+    def test_binary_not_compressed(self):
+        """Les images ne sont pas recompressées"""
+        variants = compress_variants(b"\x89PNG" * 100, 'image/png')
+        self.assertEqual(list(variants), ['identity'])
+
+class TestStaticAssets(unittest.TestCase):
+    """Tests pour l'empreinte des fichiers statiques"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        os.makedirs(os.path.join(self.tmp.name, 'css'))
+        with open(os.path.join(self.tmp.name, 'css', 'style.css'), 'wb') as f:
+            f.write(b"body { margin: 0; }\n" * 50)
+        self.assets = StaticAssets(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_fingerprint(self):
+        """Le nom contient une empreinte du contenu"""
+        name = self.assets.fingerprint('css/style.css')
+        self.assertRegex(name, r'^css/style\.[0-9a-f]{12}\.css$')
+        self.assertIsNotNone(self.assets.get(name))
+        self.assertIsNone(self.assets.get('css/style.css'))
+
+    def test_unknown_file(self):
+        """Un fichier inconnu garde son nom"""
+        self.assertEqual(self.assets.fingerprint('js/none.js'), 'js/none.js')
+
+class TestCachedContent(unittest.TestCase):
+    """Tests pour les réponses en cache"""
+
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.content = CachedContent(b"<p>Bonjour</p>" * 50, 'text/html')
+
+    def test_gzip_negotiated(self):
+        """L'encodage est choisi selon Accept-Encoding"""
+        with self.app.test_request_context(headers={'Accept-Encoding': 'gzip'}):
+            response = self.content.make_response()
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        self.assertIn('no-cache', response.headers['Cache-Control'])
+
+    def test_brotli_negotiated(self):
+        """Brotli est préféré à gzip quand le client accepte les deux"""
+        headers = {'Accept-Encoding': 'gzip, br'}
+        with self.app.test_request_context(headers=headers):
+            response = self.content.make_response()
+        self.assertEqual(response.headers['Content-Encoding'], 'br')
+        self.assertEqual(brotli.decompress(response.get_data()), b"<p>Bonjour</p>" * 50)
+
+    def test_not_modified(self):
+        """Un ETag correspondant donne une réponse 304"""
+        with self.app.test_request_context():
+            etag = self.content.make_response().headers['ETag']
+        with self.app.test_request_context(headers={'If-None-Match': etag}):
+            response = self.content.make_response()
+        self.assertEqual(response.status_code, 304)
+
+    def test_immutable(self):
+        """Les fichiers empreintés sont marqués immuables"""
+        with self.app.test_request_context():
+            response = self.content.make_response(max_age=3600, immutable=True)
+        self.assertIn('immutable', response.headers['Cache-Control'])
+        self.assertIn('max-age=3600', response.headers['Cache-Control'])
+
+class TestAppDelivery(unittest.TestCase):
+    """Tests de la page d'accueil et des fichiers servis par l'application"""
+
+    def setUp(self):
+        self.client = app.test_client()
+
+    def asset_links(self, html: str) -> list:
+        """Extrait les liens CSS/JS de la page"""
+        return re.findall(r'(?:href|src)="([^"]+\.(?:css|js))"', html)
+
+    def test_home_etag_and_304(self):
+        """La page d'accueil porte un ETag et répond 304 s'il correspond"""
+        response = self.client.get('/')
+        self.assertEqual(response.status_code, 200)
+        etag = response.headers['ETag']
+
+        cached = self.client.get('/', headers={'If-None-Match': etag})
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(cached.data, b'')
+
+    def test_home_links_fingerprinted_assets(self):
+        """La page pointe vers des fichiers empreintés servis en immuable"""
+        links = self.asset_links(self.client.get('/').get_data(as_text=True))
+        self.assertEqual(len(links), 2)
+        for link in links:
+            self.assertRegex(link, r'^/assets/.+\.[0-9a-f]{12}\.(css|js)$')
+            response = self.client.get(link)
+            self.assertEqual(response.status_code, 200)
+            self.assertIn('immutable', response.headers['Cache-Control'])
+
+    def test_identity_without_accept_encoding(self):
+        """Sans Accept-Encoding, le contenu est envoyé tel quel"""
+        link = self.asset_links(self.client.get('/').get_data(as_text=True))[0]
+        response = self.client.get(link)
+        self.assertNotIn('Content-Encoding', response.headers)
+        with open(os.path.join(app.static_folder, 'css', 'style.css'), 'rb') as f:
+            self.assertEqual(response.data, f.read())
+
+    def test_gzip_with_accept_encoding(self):
+        """Avec Accept-Encoding: gzip, la variante compressée est envoyée"""
+        link = self.asset_links(self.client.get('/').get_data(as_text=True))[0]
+        response = self.client.get(link, headers={'Accept-Encoding': 'gzip'})
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        self.assertIn(b'body', gzip.decompress(response.data))
+
+    def test_brotli_with_accept_encoding(self):
+        """Avec Accept-Encoding: br, la variante brotli est envoyée"""
+        link = self.asset_links(self.client.get('/').get_data(as_text=True))[0]
+        response = self.client.get(link, headers={'Accept-Encoding': 'br'})
+        self.assertEqual(response.headers['Content-Encoding'], 'br')
+        self.assertIn(b'body', brotli.decompress(response.data))
+
+    def test_unhashed_asset_not_found(self):
+        """Un nom sans empreinte n'est pas servi sous /assets/"""
+        self.assertEqual(self.client.get('/assets/css/style.css').status_code, 404)
+
+    def test_debug_uses_static(self):
+        """En mode debug, les liens pointent vers /static sans empreinte"""
+        app.debug = True
+        try:
+            html = self.client.get('/').get_data(as_text=True)
+        finally:
+            app.debug = False
+        self.assertIn('/static/css/style.css', self.asset_links(html))
+
+        # Le rendu debug ne doit pas rester en cache
+        html = self.client.get('/').get_data(as_text=True)
+        self.assertNotIn('/static/css/style.css', self.asset_links(html))
+
+class TestWithoutAnalyzer(unittest.TestCase):
+    """Le cache reste actif si l'analyseur ne peut pas être importé"""
+
+    SCRIPT = '''
+import json, sys
+sys.modules['requests'] = None  # simule une dépendance manquante
+import app
+client = app.app.test_client()
+first = client.get('/')
+second = client.get('/', headers={'If-None-Match': first.headers['ETag']})
+print(json.dumps({
+    'package_loaded': app.PACKAGE_LOADED,
+    'static_cache_loaded': app.STATIC_CACHE_LOADED,
+    'statuses': [first.status_code, second.status_code],
+    'html': first.get_data(as_text=True),
+}))
+'''
+
+    def test_cache_without_analyzer(self):
+        """Page en cache et fichiers empreintés sans le package d'analyse"""
+        root = os.path.join(os.path.dirname(__file__), '..')
+        output = subprocess.run(
+            [sys.executable, '-c', self.SCRIPT],
+            cwd=root, capture_output=True, text=True, check=True
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+
+        self.assertFalse(result['package_loaded'])
+        self.assertTrue(result['static_cache_loaded'])
+        self.assertEqual(result['statuses'], [200, 304])
+        self.assertRegex(result['html'], r'/assets/css/style\.[0-9a-f]{12}\.css')
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)